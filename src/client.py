@@ -2,11 +2,20 @@
 """API client for open.go.kr original document disclosure portal."""
 
 import json
+import math
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, cast
+from types import TracebackType
+from typing import Any, Self, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_QUOTE, _BACKSLASH, _LBRACE, _RBRACE = b'"\\{}'
+
+_DATE8 = re.compile(r"(\d{4})(\d{2})(\d{2})")
 
 
 class OpenGoKrError(Exception):
@@ -15,7 +24,7 @@ class OpenGoKrError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Document:
     """Represents a disclosed document."""
 
@@ -31,7 +40,10 @@ class OpenGoKrClient:
     PAGE_URL = "https://www.open.go.kr/othicInfo/infoList/orginlInfoList.do"
     PAGE_SIZE = 10
     REQUEST_TIMEOUT = 30
-    _RESULT_RE = re.compile(r"var\s+result\s*=\s*(\{.*?\});", re.DOTALL)
+    POOL_SIZE = 32
+    # Safety cap: a corrupt rtnTotal must not turn into thousands of
+    # requests against the portal.
+    MAX_PAGES = 1000
 
     def __init__(self, session: requests.Session | None = None) -> None:
         """Initialize client with optional session.
@@ -41,6 +53,24 @@ class OpenGoKrClient:
         """
         self.session = session or requests.Session()
         self._setup_headers()
+        self._setup_adapter()
+
+    def close(self) -> None:
+        """Close the session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the session on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the session when leaving the context."""
+        self.close()
 
     def _setup_headers(self) -> None:
         """Configure default headers for requests."""
@@ -51,28 +81,45 @@ class OpenGoKrClient:
                 "Accept": "text/html,application/xhtml+xml,"
                 "application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "ko,en;q=0.9",
+                # Session keep-alive is the default, but some WAFs drop
+                # connections unless the header is explicit.
+                "Connection": "keep-alive",
             }
         )
 
+    def _setup_adapter(self) -> None:
+        """Mount a pooled HTTP adapter with retries for transient errors."""
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                # The list endpoint is an idempotent search, so retrying
+                # its POSTs is safe; urllib3 excludes POST by default.
+                allowed_methods=("POST",),
+            ),
+        )
+        self.session.mount("https://", adapter)
+
     def _build_request_params(
         self,
         agency_code: str,
         agency_name: str,
         start_date: str,
         end_date: str,
-        page: int = 1,
     ) -> dict[str, str]:
-        """Build request parameters for page request.
+        """Build the form parameters shared by every page request.
 
         Args:
             agency_code: Institution code (e.g., "1342000" for 교육부).
             agency_name: Institution name (e.g., "교육부").
             start_date: Start date in YYYY-MM-DD format.
             end_date: End date in YYYY-MM-DD format.
-            page: Page number (1-indexed).
 
         Returns:
-            Dictionary of form parameters.
+            Dictionary of form parameters without the page number.
         """
         start_formatted = start_date.replace("-", "")
         end_formatted = end_date.replace("-", "")
@@ -82,16 +129,18 @@ class OpenGoKrClient:
             "startDate": start_formatted,
             "endDate": end_formatted,
             "eduYn": "N",
-            "viewPage": str(page),
             "rowPage": str(self.PAGE_SIZE),
             "sort": "s",
         }
 
-    def _extract_result_from_html(self, html: str) -> dict[str, Any]:
-        """Extract the embedded result JSON from page HTML.
+    def _extract_result_from_html(self, html: bytes) -> dict[str, Any]:
+        """Extract the embedded result JSON from raw page bytes.
+
+        Working on bytes skips decoding the whole page to str just to
+        locate the embedded object; json.loads accepts UTF-8 bytes.
 
         Args:
-            html: HTML content from page response.
+            html: Raw HTML bytes from page response.
 
         Returns:
             Parsed JSON result object.
@@ -100,15 +149,56 @@ class OpenGoKrClient:
             OpenGoKrError: If result cannot be extracted.
         """
         # Look for: var result = {...};
-        match = self._RESULT_RE.search(html)
-        if not match:
+        anchor = html.find(b"var result")
+        start = html.find(b"{", anchor) if anchor != -1 else -1
+        if start == -1:
+            raise OpenGoKrError("Could not find result data in page HTML")
+
+        end = self._find_object_end(html, start)
+        if end == -1:
             raise OpenGoKrError("Could not find result data in page HTML")
 
         try:
-            return cast(dict[str, Any], json.loads(match.group(1)))
+            return cast(dict[str, Any], json.loads(html[start:end]))
         except json.JSONDecodeError as e:
             raise OpenGoKrError(f"Failed to parse result JSON: {e}") from e
 
+    @staticmethod
+    def _find_object_end(html: bytes, start: int) -> int:
+        """Find the end of a brace-balanced object literal.
+
+        UTF-8 continuation bytes never collide with the ASCII bytes the
+        scan compares against, so byte-wise scanning is safe.
+
+        Args:
+            html: Raw bytes containing the object.
+            start: Index of the opening brace.
+
+        Returns:
+            Index one past the closing brace, or -1 if unterminated.
+        """
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(html)):
+            ch = html[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == _BACKSLASH:
+                    escaped = True
+                elif ch == _QUOTE:
+                    in_string = False
+            elif ch == _QUOTE:
+                in_string = True
+            elif ch == _LBRACE:
+                depth += 1
+            elif ch == _RBRACE:
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+        return -1
+
     def _parse_response(self, data: dict[str, Any]) -> tuple[list[Document], int]:
         """Parse result data into Document objects.
 
@@ -125,23 +215,80 @@ class OpenGoKrClient:
             return [], 0
 
         documents = []
+        # Items on a page almost always share one production day, so format
+        # each distinct YYYYMMDD prefix once instead of per item.
+        last_day: str | None = None
+        formatted_date = ""
         for item in doc_list:
-            # Format date from YYYYMMDDHHMMSS to YYYY-MM-DD
-            raw_date = item.get("PRDCTN_DT", "")
-            formatted_date = ""
-            if raw_date and len(raw_date) >= 8:
-                formatted_date = f"{raw_date[:4]}-{raw_date[4:6]}-{raw_date[6:8]}"
-
-            doc = Document(
-                title=item.get("INFO_SJ", ""),
-                date=formatted_date,
-                url="",  # URL not available in this response format
-                agency_name=item.get("PROC_INSTT_NM", ""),
+            # Format date from YYYYMMDDHHMMSS to YYYY-MM-DD; the API
+            # sometimes sends an explicit null timestamp.
+            raw_date = item.get("PRDCTN_DT") or ""
+            day = raw_date[:8]
+            if day != last_day:
+                last_day = day
+                match = _DATE8.match(day)
+                formatted_date = "-".join(match.groups()) if match else ""
+
+            # Positional construction; field order is title, date, url,
+            # agency_name. URL is not available in this response format.
+            documents.append(
+                Document(
+                    item.get("INFO_SJ", ""),
+                    formatted_date,
+                    "",
+                    item.get("PROC_INSTT_NM", ""),
+                )
             )
-            documents.append(doc)
 
         return documents, int(total_count or 0)
 
+    def _post_and_parse(self, params: dict[str, str]) -> dict[str, Any]:
+        """POST the list endpoint and return the embedded result object.
+
+        Args:
+            params: Form parameters for the request.
+
+        Returns:
+            Parsed result JSON.
+
+        Raises:
+            OpenGoKrError: On network or parsing errors.
+        """
+        try:
+            response = self.session.post(
+                self.PAGE_URL,
+                data=params,
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            return self._extract_result_from_html(response.content)
+        except requests.exceptions.ConnectionError as e:
+            raise OpenGoKrError(f"Network connection error: {e}") from e
+        except requests.exceptions.Timeout as e:
+            raise OpenGoKrError(f"Request timeout: {e}") from e
+        except requests.exceptions.RequestException as e:
+            raise OpenGoKrError(f"Request failed: {e}") from e
+
+    def _fetch_page(
+        self,
+        base_params: dict[str, str],
+        page: int,
+    ) -> tuple[list[Document], int]:
+        """Fetch and parse a single result page.
+
+        Args:
+            base_params: Shared form parameters from _build_request_params.
+            page: Page number (1-indexed).
+
+        Returns:
+            Tuple of (list of Document objects, total count).
+
+        Raises:
+            OpenGoKrError: On network or parsing errors.
+        """
+        data = self._post_and_parse({**base_params, "viewPage": str(page)})
+        return self._parse_response(data)
+
     def fetch_documents(
         self,
         agency_code: str,
@@ -166,44 +313,23 @@ class OpenGoKrClient:
         if end_date is None:
             end_date = start_date
 
-        all_documents: list[Document] = []
-        fetched_count = 0
-        page = 1
-
-        while True:
-            try:
-                params = self._build_request_params(
-                    agency_code, agency_name, start_date, end_date, page
-                )
-                response = self.session.post(
-                    self.PAGE_URL,
-                    data=params,
-                    timeout=self.REQUEST_TIMEOUT,
+        base_params = self._build_request_params(
+            agency_code, agency_name, start_date, end_date
+        )
+        documents, total_count = self._fetch_page(base_params, page=1)
+
+        # Page count is known once page 1 reports the total, so fetch the
+        # remaining pages in parallel instead of one round-trip per page.
+        # A short first page means the reported total is not trustworthy,
+        # in which case pagination stops (as the sequential loop did).
+        if len(documents) == self.PAGE_SIZE and total_count > self.PAGE_SIZE:
+            n_pages = min(math.ceil(total_count / self.PAGE_SIZE), self.MAX_PAGES)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                extra_pages = executor.map(
+                    lambda page: self._fetch_page(base_params, page),
+                    range(2, n_pages + 1),
                 )
-                response.raise_for_status()
-                data = self._extract_result_from_html(response.text)
-            except requests.exceptions.ConnectionError as e:
-                raise OpenGoKrError(f"Network connection error: {e}") from e
-            except requests.exceptions.Timeout as e:
-                raise OpenGoKrError(f"Request timeout: {e}") from e
-            except requests.exceptions.RequestException as e:
-                raise OpenGoKrError(f"Request failed: {e}") from e
-
-            documents, total_count = self._parse_response(data)
-            fetched_count += len(documents)
-            filtered_documents = [
-                doc for doc in documents if "인사발령" not in doc.title
-            ]
-            all_documents.extend(filtered_documents)
-
-            # Check if we need to fetch more pages
-            if not documents:
-                break
-            if fetched_count >= total_count:
-                break
-            if len(documents) < self.PAGE_SIZE:
-                break
-
-            page += 1
-
-        return all_documents
+                for page_documents, _ in extra_pages:
+                    documents.extend(page_documents)
+
+        return [doc for doc in documents if "인사발령" not in doc.title]
@@ -1,13 +1,14 @@
 # Trace: spec_id=SPEC-api-client-001 task_id=TASK-0004
 """Configuration loader for agency settings."""
 
+import functools
+import json
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-import yaml
 
-
-@dataclass
+@dataclass(slots=True)
 class Agency:
     """Represents a government agency to monitor."""
 
@@ -15,9 +16,102 @@ class Agency:
     name: str
 
 
+# (mtime_ns, size) of the YAML file plus the same for its JSON sidecar
+# (None when absent); either file changing invalidates the cache entry.
+_Signature = tuple[int, int, tuple[int, int] | None]
+
+
+def _config_signature(config_path: Path) -> _Signature:
+    """Build the cache signature for a config path and its sidecar.
+
+    Args:
+        config_path: Path to the agencies.yaml file.
+
+    Returns:
+        Signature tuple covering both the YAML file and the sidecar.
+    """
+    stat = config_path.stat()
+    try:
+        sidecar_stat = config_path.with_suffix(".json").stat()
+        sidecar_signature = (sidecar_stat.st_mtime_ns, sidecar_stat.st_size)
+    except OSError:
+        sidecar_signature = None
+    return (stat.st_mtime_ns, stat.st_size, sidecar_signature)
+
+
+def _read_config(config_path: Path) -> Any:
+    """Read config data, preferring a JSON sidecar cache over the YAML.
+
+    The sidecar (same name, .json suffix) is written after each YAML
+    parse and reused while it is at least as new as the YAML file, which
+    makes repeated process startups skip the YAML parse entirely. The
+    YAML file remains the source of truth.
+
+    Args:
+        config_path: Path to the agencies.yaml file.
+
+    Returns:
+        Parsed config data.
+    """
+    sidecar = config_path.with_suffix(".json")
+    try:
+        if sidecar.stat().st_mtime_ns >= config_path.stat().st_mtime_ns:
+            with open(sidecar, encoding="utf-8") as f:
+                return json.load(f)
+    except OSError:
+        pass  # Missing sidecar; fall back to the YAML.
+    except ValueError:
+        pass  # Unreadable sidecar; fall back to the YAML.
+
+    # Imported lazily: a fresh sidecar means startup never pays for
+    # importing PyYAML at all.
+    import yaml
+
+    try:
+        # libyaml bindings parse ~10x faster than the pure-Python loader.
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:  # pragma: no cover - depends on how PyYAML was built
+        from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+    with open(config_path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+
+    try:
+        sidecar.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    except OSError:  # pragma: no cover - e.g. read-only config directory
+        pass  # The cache is purely an optimization.
+
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _load_agencies_cached(key: str, signature: _Signature) -> list[Agency]:
+    """Read and parse the config for one (path, file state) combination.
+
+    Args:
+        key: Config path as a string (lru_cache needs hashable keys).
+        signature: File-state signature; unused in the body, it keys the
+            cache so entries go stale when either file changes on disk.
+
+    Returns:
+        List of Agency objects.
+    """
+    data = _read_config(Path(key))
+
+    agencies = []
+    for item in data.get("agencies", []):
+        agency = Agency(code=item["code"], name=item["name"])
+        agencies.append(agency)
+
+    return agencies
+
+
 def load_agencies(config_path: Path) -> list[Agency]:
     """Load agency configuration from YAML file.
 
+    Repeated loads of an unchanged file return the in-process cached
+    list (keyed on the files' mtime and size) without re-parsing.
+
     Args:
         config_path: Path to the agencies.yaml file.
 
@@ -30,12 +124,15 @@ def load_agencies(config_path: Path) -> list[Agency]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    key = str(config_path)
+    signature = _config_signature(config_path)
+    agencies = _load_agencies_cached(key, signature)
 
-    agencies = []
-    for item in data.get("agencies", []):
-        agency = Agency(code=item["code"], name=item["name"])
-        agencies.append(agency)
+    current = _config_signature(config_path)
+    if current != signature:
+        # Parsing the YAML just (re)wrote the sidecar, which shifts the
+        # signature. Re-key under the on-disk state — a cheap JSON read —
+        # so subsequent calls hit this entry.
+        agencies = _load_agencies_cached(key, current)
 
     return agencies
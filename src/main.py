@@ -2,11 +2,11 @@
 # Trace: spec_id=SPEC-code-quality-001 task_id=TASK-0008
 """Main entry point for the notification service."""
 
-import argparse
+import functools
 import logging
 import os
-import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 
 from client import Document, OpenGoKrClient, OpenGoKrError
@@ -33,22 +33,24 @@ def get_target_date_range(today_override: datetime | None = None) -> tuple[str,
         Tuple of (start_date, end_date) strings in YYYY-MM-DD format.
     """
     today = today_override or datetime.now()
-    weekday = today.weekday()  # 0=Monday, 4=Friday
+    ordinal = today.toordinal()
 
-    if weekday == 0:  # Monday
-        # Query from Friday (3 days ago) to Sunday (1 day ago)
-        start_date = today - timedelta(days=3)  # Friday
-        end_date = today - timedelta(days=1)  # Sunday
-    else:
-        # Tuesday-Sunday: just yesterday
-        start_date = today - timedelta(days=1)
-        end_date = start_date
+    # Integer day arithmetic: Monday (weekday 0) reaches back to Friday,
+    # every other day just covers yesterday.
+    start_offset = 3 if today.weekday() == 0 else 1
+    start_date = date.fromordinal(ordinal - start_offset)
+    end_date = date.fromordinal(ordinal - 1)
 
-    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+    return start_date.isoformat(), end_date.isoformat()
 
 
-def find_config_path() -> Path:
-    """Find the agencies.yaml config file.
+@functools.lru_cache(maxsize=1)
+def _find_config_path_cached(script_path: str, cwd: str) -> Path:
+    """Probe the config candidates for one (script, cwd) combination.
+
+    Args:
+        script_path: Path of the running script file.
+        cwd: Current working directory.
 
     Returns:
         Path to the config file.
@@ -56,27 +58,47 @@ def find_config_path() -> Path:
     Raises:
         FileNotFoundError: If config file not found.
     """
-    # Check common locations
-    candidates = [
-        # Path relative to the script file (most reliable when running from source)
-        Path(__file__).parent.parent / "config" / "agencies.yaml",
-        # Path relative to current working directory
-        Path("config/agencies.yaml"),
-    ]
-
-    for path in candidates:
-        if path.exists():
-            return path
+    # os.path string probes: one stat per candidate, no intermediate Path
+    # objects until the winner is wrapped for the caller.
+    # Script-relative location first (most reliable when running from source).
+    script_candidate = os.path.normpath(
+        os.path.join(os.path.dirname(script_path), "..", "config", "agencies.yaml")
+    )
+    if os.path.isfile(script_candidate):
+        return Path(script_candidate)
+
+    # Fall back to the current working directory.
+    cwd_candidate = os.path.join(cwd, "config", "agencies.yaml")
+    if os.path.isfile(cwd_candidate):
+        return Path(cwd_candidate)
 
     raise FileNotFoundError("agencies.yaml not found. Expected in config/agencies.yaml")
 
 
+def find_config_path() -> Path:
+    """Find the agencies.yaml config file.
+
+    The result is cached per (script location, working directory), so
+    repeated calls in one process skip the filesystem probes.
+
+    Returns:
+        Path to the config file.
+
+    Raises:
+        FileNotFoundError: If config file not found.
+    """
+    return _find_config_path_cached(__file__, os.getcwd())
+
+
 def main() -> int:
     """Run the notification service.
 
     Returns:
         Exit code (0 for success, 1 for error).
     """
+    # Imported lazily so --help and early error exits skip the module load.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Fetch and notify about government document disclosures"
     )
@@ -146,24 +168,37 @@ def main() -> int:
     api_client = OpenGoKrClient()
     notifier = TelegramNotifier(bot_token, chat_id)
 
-    # Process each agency with date range (single API call per agency)
+    # Fetch agencies concurrently (network-bound, one API call per agency);
+    # results are collected in submission order to keep notification output
+    # stable regardless of completion order.
     all_results: list[tuple[str, list[Document]]] = []
     has_errors = False
 
-    for agency in agencies:
-        logger.info(f"Processing agency: {agency.name} ({agency.code})")
-
-        try:
-            documents = api_client.fetch_documents(
-                agency.code, agency.name, start_date, end_date
+    with ThreadPoolExecutor(max_workers=min(8, len(agencies))) as executor:
+        futures = []
+        for agency in agencies:
+            logger.info(f"Processing agency: {agency.name} ({agency.code})")
+            futures.append(
+                (
+                    agency,
+                    executor.submit(
+                        api_client.fetch_documents,
+                        agency.code,
+                        agency.name,
+                        start_date,
+                        end_date,
+                    ),
+                )
             )
-            logger.info(f"Found {len(documents)} documents for {agency.name}")
-            all_results.append((agency.name, documents))
 
-        except OpenGoKrError as e:
-            logger.error(f"API error for {agency.name}: {e}")
-            has_errors = True
-            continue
+        for agency, future in futures:
+            try:
+                documents = future.result()
+                logger.info(f"Found {len(documents)} documents for {agency.name}")
+                all_results.append((agency.name, documents))
+            except OpenGoKrError as e:
+                logger.error(f"API error for {agency.name}: {e}")
+                has_errors = True
 
     # Send consolidated notification for all agencies
     total_documents = sum(len(docs) for _, docs in all_results)
@@ -183,4 +218,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    raise SystemExit(main())
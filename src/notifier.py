@@ -1,7 +1,12 @@
 # Trace: spec_id=SPEC-telegram-notifier-001 task_id=TASK-0002
 """Telegram notification service for document alerts."""
 
+import functools
+import json
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from client import Document
 
@@ -12,11 +17,34 @@ class TelegramError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _escape_markdown_cached(text: str) -> str:
+    """Escape a low-cardinality string (agency name, date) with caching.
+
+    Agency names and dates repeat across messages and runs, so their
+    escaped forms are memoized. Titles go through the uncached path.
+
+    Args:
+        text: Text to escape.
+
+    Returns:
+        Escaped text safe for MarkdownV2.
+    """
+    return text.translate(TelegramNotifier._MD_ESCAPE_TABLE)
+
+
 class TelegramNotifier:
     """Send notifications via Telegram Bot API."""
 
+    __slots__ = ("bot_token", "chat_id", "session", "_api_url", "_base_payload")
+
     API_BASE = "https://api.telegram.org"
     MAX_MESSAGE_LENGTH = 4096
+    _MD_ESCAPE_TABLE = str.maketrans(
+        {char: f"\\{char}" for char in "\\_*[]()~`>#+-=|{}.!"}
+    )
+    # Pre-escaped form of " [바로가기]", appended to titles that carry a URL.
+    _LINK_SUFFIX = " \\[바로가기\\]"
 
     def __init__(self, bot_token: str, chat_id: str) -> None:
         """Initialize notifier with Telegram credentials.
@@ -28,11 +56,28 @@ class TelegramNotifier:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.session = requests.Session()
-
-    @property
-    def _api_url(self) -> str:
-        """Get the sendMessage API endpoint URL."""
-        return f"{self.API_BASE}/bot{self.bot_token}/sendMessage"
+        self._setup_session()
+        self._api_url = f"{self.API_BASE}/bot{bot_token}/sendMessage"
+        self._base_payload: dict[str, str | bool] = {
+            "chat_id": chat_id,
+            "parse_mode": "MarkdownV2",
+            "disable_web_page_preview": True,
+        }
+
+    def _setup_session(self) -> None:
+        """Configure connection pooling and retries for the Telegram API."""
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("POST",),
+            ),
+        )
+        self.session.mount("https://", adapter)
 
     def _escape_markdown(self, text: str) -> str:
         """Escape special characters for MarkdownV2.
@@ -43,13 +88,7 @@ class TelegramNotifier:
         Returns:
             Escaped text safe for MarkdownV2.
         """
-        special_chars = "\\_*[]()~`>#+-=|{}.!"
-        for char in special_chars:
-            if char == "\\":
-                text = text.replace("\\", "\\\\")
-            else:
-                text = text.replace(char, f"\\{char}")
-        return text
+        return text.translate(self._MD_ESCAPE_TABLE)
 
     def _escape_markdown_url(self, url: str) -> str:
         """Escape URL for Telegram MarkdownV2 link.
@@ -62,19 +101,40 @@ class TelegramNotifier:
         """
         return url.replace("\\", "\\\\").replace(")", "\\)")
 
-    def _format_title(self, document: Document) -> str:
-        """Format document title with optional link suffix.
+    def _build_document_lines(
+        self, agency_name: str, date: str, documents: list[Document]
+    ) -> list[str]:
+        """Build the message lines for a single-agency notification.
 
         Args:
-            document: Document to format.
+            agency_name: Name of the agency.
+            date: Date of the documents.
+            documents: List of documents to format.
 
         Returns:
-            Escaped title string for MarkdownV2.
+            List of physical lines (empty strings are blank lines).
         """
-        title = document.title
-        if document.url:
-            title = f"{title} [바로가기]"
-        return self._escape_markdown(title)
+        escaped_agency = _escape_markdown_cached(agency_name)
+        escaped_date = _escape_markdown_cached(date)
+        lines = [f"📋 *{escaped_agency} 원문정보 \\({escaped_date}\\)*", ""]
+
+        if not documents:
+            lines.append("공개된 문서가 없습니다\\.")
+            return lines
+
+        for i, doc in enumerate(documents, 1):
+            escaped_title = self._escape_markdown(doc.title)
+            if doc.url:
+                escaped_url = self._escape_markdown_url(doc.url)
+                lines.append(
+                    f"{i}\\. [{escaped_title}{self._LINK_SUFFIX}]({escaped_url})"
+                )
+            else:
+                lines.append(f"{i}\\. {escaped_title}")
+
+        lines.append("")
+        lines.append(f"총 {len(documents)}건")
+        return lines
 
     def _format_documents_message(
         self, agency_name: str, date: str, documents: list[Document]
@@ -89,56 +149,43 @@ class TelegramNotifier:
         Returns:
             Formatted message string.
         """
-        if not documents:
-            escaped_agency = self._escape_markdown(agency_name)
-            escaped_date = self._escape_markdown(date)
-            return (
-                f"📋 *{escaped_agency} 원문정보 \\({escaped_date}\\)*\n\n"
-                "공개된 문서가 없습니다\\."
-            )
+        return "\n".join(self._build_document_lines(agency_name, date, documents))
 
-        escaped_agency = self._escape_markdown(agency_name)
-        escaped_date = self._escape_markdown(date)
-        header = f"📋 *{escaped_agency} 원문정보 \\({escaped_date}\\)*\n\n"
+    def _chunk_lines(self, lines: list[str]) -> list[str]:
+        """Assemble message lines into chunks within Telegram's limit.
 
-        lines = []
-        for i, doc in enumerate(documents, 1):
-            escaped_title = self._format_title(doc)
-            if doc.url:
-                escaped_url = self._escape_markdown_url(doc.url)
-                lines.append(f"{i}\\. [{escaped_title}]({escaped_url})")
-            else:
-                lines.append(f"{i}\\. {escaped_title}")
-
-        footer = f"\n\n총 {len(documents)}건"
-        return header + "\n".join(lines) + footer
-
-    def _split_message(self, message: str) -> list[str]:
-        """Split message into chunks that fit Telegram's limit.
+        Fuses message assembly and splitting into one pass over the
+        lines, so the full message string is never materialized when the
+        message needs splitting.
 
         Args:
-            message: Full message to split.
+            lines: Physical message lines.
 
         Returns:
             List of message chunks.
         """
-        if len(message) <= self.MAX_MESSAGE_LENGTH:
-            return [message]
+        total_len = sum(len(line) for line in lines) + len(lines) - 1
+        if total_len <= self.MAX_MESSAGE_LENGTH:
+            return ["\n".join(lines)]
 
         chunks = []
-        lines = message.split("\n")
-        current_chunk = ""
+        buffer: list[str] = []
+        buffer_len = 0
 
         for line in lines:
-            if len(current_chunk) + len(line) + 1 > self.MAX_MESSAGE_LENGTH:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = line + "\n"
+            if buffer_len + len(line) + 1 > self.MAX_MESSAGE_LENGTH:
+                if buffer:
+                    chunks.append("".join(buffer).strip())
+                buffer = [line, "\n"]
+                buffer_len = len(line) + 1
             else:
-                current_chunk += line + "\n"
+                buffer.append(line)
+                buffer.append("\n")
+                buffer_len += len(line) + 1
 
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        tail = "".join(buffer).strip()
+        if tail:
+            chunks.append(tail)
 
         return chunks
 
@@ -157,16 +204,13 @@ class TelegramNotifier:
         try:
             response = self.session.post(
                 self._api_url,
-                data={
-                    "chat_id": self.chat_id,
-                    "text": text,
-                    "parse_mode": "MarkdownV2",
-                    "disable_web_page_preview": "true",
-                },
+                json={**self._base_payload, "text": text},
                 timeout=30,
             )
 
-            result = response.json()
+            # json.loads on the raw bytes skips the charset detection
+            # that response.json() goes through.
+            result = json.loads(response.content)
 
             if not result.get("ok"):
                 error_code = result.get("error_code", "unknown")
@@ -177,6 +221,8 @@ class TelegramNotifier:
 
         except requests.exceptions.RequestException as e:
             raise TelegramError(f"Network error: {e}") from e
+        except json.JSONDecodeError as e:
+            raise TelegramError(f"Invalid API response: {e}") from e
 
     def send_documents(
         self, agency_name: str, date: str, documents: list[Document]
@@ -194,8 +240,8 @@ class TelegramNotifier:
         Raises:
             TelegramError: On API or network errors.
         """
-        message = self._format_documents_message(agency_name, date, documents)
-        chunks = self._split_message(message)
+        lines = self._build_document_lines(agency_name, date, documents)
+        chunks = self._chunk_lines(lines)
 
         for chunk in chunks:
             self._send_message(chunk)
@@ -217,58 +263,73 @@ class TelegramNotifier:
         Raises:
             TelegramError: On API or network errors.
         """
-        message = self._format_multi_agency_message(date, agencies_documents)
-        chunks = self._split_message(message)
+        lines = self._build_multi_agency_lines(date, agencies_documents)
+        chunks = self._chunk_lines(lines)
 
         for chunk in chunks:
             self._send_message(chunk)
 
         return True
 
-    def _format_multi_agency_message(
+    def _build_multi_agency_lines(
         self, date: str, agencies_documents: list[tuple[str, list[Document]]]
-    ) -> str:
-        """Format documents from multiple agencies into a single message.
+    ) -> list[str]:
+        """Build the message lines for a multi-agency notification.
 
         Args:
             date: Date or date range string.
             agencies_documents: List of (agency_name, documents) tuples.
 
         Returns:
-            Formatted message string with all agencies.
+            List of physical lines (empty strings are blank lines).
         """
+        escaped_date = _escape_markdown_cached(date)
         if not agencies_documents:
-            escaped_date = self._escape_markdown(date)
-            return f"📋 *원문정보 \\({escaped_date}\\)*\n\n공개된 문서가 없습니다\\."
+            return [
+                f"📋 *원문정보 \\({escaped_date}\\)*",
+                "",
+                "공개된 문서가 없습니다\\.",
+            ]
 
-        # Count total documents
         total_docs = sum(len(docs) for _, docs in agencies_documents)
         agency_count = len(agencies_documents)
 
-        escaped_date = self._escape_markdown(date)
-        header = (
-            f"📋 *원문정보 \\({escaped_date}\\)*\n\n"
-            f"총 {agency_count}개 부서, {total_docs}건\n\n"
-        )
+        lines = [
+            f"📋 *원문정보 \\({escaped_date}\\)*",
+            "",
+            f"총 {agency_count}개 부서, {total_docs}건",
+        ]
 
-        sections = []
         for agency_name, documents in agencies_documents:
             if not documents:
                 continue
 
-            escaped_agency = self._escape_markdown(agency_name)
-            section_header = f"▫️ *{escaped_agency}* \\({len(documents)}건\\)\n"
+            escaped_agency = _escape_markdown_cached(agency_name)
+            lines.append("")
+            lines.append(f"▫️ *{escaped_agency}* \\({len(documents)}건\\)")
 
-            lines = []
             for i, doc in enumerate(documents, 1):
-                escaped_title = self._format_title(doc)
+                escaped_title = self._escape_markdown(doc.title)
                 if doc.url:
                     escaped_url = self._escape_markdown_url(doc.url)
-                    lines.append(f"  {i}\\. [{escaped_title}]({escaped_url})")
+                    lines.append(
+                        f"  {i}\\. [{escaped_title}{self._LINK_SUFFIX}]({escaped_url})"
+                    )
                 else:
                     lines.append(f"  {i}\\. {escaped_title}")
 
-            section = section_header + "\n".join(lines)
-            sections.append(section)
+        return lines
 
-        return header + "\n\n".join(sections)
+    def _format_multi_agency_message(
+        self, date: str, agencies_documents: list[tuple[str, list[Document]]]
+    ) -> str:
+        """Format documents from multiple agencies into a single message.
+
+        Args:
+            date: Date or date range string.
+            agencies_documents: List of (agency_name, documents) tuples.
+
+        Returns:
+            Formatted message string with all agencies.
+        """
+        return "\n".join(self._build_multi_agency_lines(date, agencies_documents))
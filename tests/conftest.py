@@ -0,0 +1,38 @@
+# Trace: spec_id=SPEC-api-client-001 task_id=TASK-0011
+"""Shared fixtures for the test suite."""
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+import main as main_module
+from client import OpenGoKrClient
+
+
+@pytest.fixture
+def client() -> Iterator[OpenGoKrClient]:
+    """Create a client instance for testing, closed after the test."""
+    with OpenGoKrClient() as client:
+        yield client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _environ_snapshot() -> Iterator[None]:
+    """Restore os.environ to its pre-session state after the suite.
+
+    A safety net under the env fixtures and monkeypatch calls in the
+    individual modules; those stay, since they also isolate tests from
+    each other within the session.
+    """
+    saved = dict(os.environ)
+    yield
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture(autouse=True)
+def _reset_config_path_cache() -> Iterator[None]:
+    """Clear the find_config_path cache so probes stay test-isolated."""
+    yield
+    main_module._find_config_path_cached.cache_clear()
@@ -1,6 +1,7 @@
 # Trace: spec_id=SPEC-api-client-001 task_id=TASK-0011
 """Tests for OpenGoKrClient."""
 
+import functools
 import json
 
 import pytest
@@ -9,18 +10,23 @@ import responses
 from client import Document, OpenGoKrClient, OpenGoKrError
 
 
+@functools.cache
+def _doc_item(i: int) -> dict[str, str]:
+    """Build (and memoize) one mock list row for pagination tests."""
+    return {
+        "INFO_SJ": f"문서 {i}",
+        "PRDCTN_DT": "20251227120000",
+        "PROC_INSTT_NM": "교육부",
+    }
+
+
 class TestOpenGoKrClient:
     """Test suite for OpenGoKrClient."""
 
     PAGE_URL = "https://www.open.go.kr/othicInfo/infoList/orginlInfoList.do"
 
-    @pytest.fixture
-    def client(self) -> OpenGoKrClient:
-        """Create a client instance for testing."""
-        return OpenGoKrClient()
-
     def _make_html_response(
-        self, rtn_list: list[dict[str, str]], rtn_total: int
+        self, rtn_list: list[dict[str, str | None]], rtn_total: int
     ) -> str:
         """Create mock HTML response with embedded JSON."""
         result_json = json.dumps({"rtnList": rtn_list, "rtnTotal": rtn_total})
@@ -167,6 +173,31 @@ class TestOpenGoKrClient:
         # URL not available in HTML parsing approach
         assert doc.url == ""
 
+    @responses.activate
+    def test_fetch_documents_null_timestamp_yields_empty_date(
+        self, client: OpenGoKrClient
+    ) -> None:
+        """Emit an empty date when the API sends a null timestamp."""
+        mock_docs: list[dict[str, str | None]] = [
+            {
+                "INFO_SJ": "날짜 없는 문서",
+                "PRDCTN_DT": None,
+                "PROC_INSTT_NM": "교육부",
+            }
+        ]
+
+        responses.add(
+            responses.POST,
+            self.PAGE_URL,
+            body=self._make_html_response(mock_docs, 1),
+            status=200,
+        )
+
+        documents = client.fetch_documents("1342000", "교육부", "2025-12-27")
+
+        assert len(documents) == 1
+        assert documents[0].date == ""
+
     @responses.activate
     def test_fetch_documents_invalid_html_raises_error(
         self, client: OpenGoKrClient
@@ -184,6 +215,23 @@ class TestOpenGoKrClient:
 
         assert "Could not find result data" in str(exc_info.value)
 
+    @responses.activate
+    def test_fetch_documents_unterminated_result_raises_error(
+        self, client: OpenGoKrClient
+    ) -> None:
+        """Raise error when the embedded result object is never closed."""
+        responses.add(
+            responses.POST,
+            self.PAGE_URL,
+            body='<html><body><script>var result = {"rtnList": [',
+            status=200,
+        )
+
+        with pytest.raises(OpenGoKrError) as exc_info:
+            client.fetch_documents("1342000", "교육부", "2025-12-27")
+
+        assert "Could not find result data" in str(exc_info.value)
+
     @responses.activate
     def test_fetch_documents_invalid_result_json_raises_error(
         self, client: OpenGoKrClient
@@ -210,14 +258,7 @@ class TestOpenGoKrClient:
     def test_fetch_documents_pagination(self, client: OpenGoKrClient) -> None:
         """Fetch all pages when documents exceed page size."""
         # First page
-        first_page_docs = [
-            {
-                "INFO_SJ": f"문서 {i}",
-                "PRDCTN_DT": "20251227120000",
-                "PROC_INSTT_NM": "교육부",
-            }
-            for i in range(10)
-        ]
+        first_page_docs = [_doc_item(i) for i in range(10)]
         responses.add(
             responses.POST,
             self.PAGE_URL,
@@ -225,14 +266,7 @@ class TestOpenGoKrClient:
             status=200,
         )
         # Second page
-        second_page_docs = [
-            {
-                "INFO_SJ": f"문서 {i}",
-                "PRDCTN_DT": "20251227120000",
-                "PROC_INSTT_NM": "교육부",
-            }
-            for i in range(10, 15)
-        ]
+        second_page_docs = [_doc_item(i) for i in range(10, 15)]
         responses.add(
             responses.POST,
             self.PAGE_URL,
@@ -247,14 +281,7 @@ class TestOpenGoKrClient:
     @responses.activate
     def test_fetch_documents_stops_on_short_page(self, client: OpenGoKrClient) -> None:
         """Stop pagination when current page has fewer rows than PAGE_SIZE."""
-        short_page_docs = [
-            {
-                "INFO_SJ": f"문서 {i}",
-                "PRDCTN_DT": "20251227120000",
-                "PROC_INSTT_NM": "교육부",
-            }
-            for i in range(3)
-        ]
+        short_page_docs = [_doc_item(i) for i in range(3)]
         responses.add(
             responses.POST,
             self.PAGE_URL,
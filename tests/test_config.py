@@ -1,50 +1,118 @@
 # Trace: spec_id=SPEC-api-client-001 task_id=TASK-0004
 """Tests for configuration loader."""
 
+import json
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 import pytest
 
 from config import Agency, load_agencies
 
 
+def _write_config(tmp_path: Path, yaml_content: str) -> Path:
+    """Write YAML content to a per-test agencies.yaml and return its path."""
+    config_path = tmp_path / "agencies.yaml"
+    config_path.write_text(yaml_content, encoding="utf-8")
+    return config_path
+
+
 class TestLoadAgencies:
     """Test suite for agency configuration loading."""
 
-    def test_load_agencies_success(self) -> None:
+    def test_load_agencies_success(self, tmp_path: Path) -> None:
         """Load agencies from valid YAML file."""
-        yaml_content = """
+        config_path = _write_config(
+            tmp_path,
+            """
 agencies:
   - code: "1342000"
     name: "교육부"
   - code: "1741000"
     name: "행정안전부"
-"""
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+""",
+        )
 
-            agencies = load_agencies(Path(f.name))
+        agencies = load_agencies(config_path)
 
-            assert len(agencies) == 2
-            assert agencies[0].code == "1342000"
-            assert agencies[0].name == "교육부"
-            assert agencies[1].code == "1741000"
-            assert agencies[1].name == "행정안전부"
+        assert len(agencies) == 2
+        assert agencies[0].code == "1342000"
+        assert agencies[0].name == "교육부"
+        assert agencies[1].code == "1741000"
+        assert agencies[1].name == "행정안전부"
 
-    def test_load_agencies_empty_list(self) -> None:
+    def test_load_agencies_empty_list(self, tmp_path: Path) -> None:
         """Return empty list when no agencies configured."""
-        yaml_content = """
+        config_path = _write_config(
+            tmp_path,
+            """
 agencies: []
-"""
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+""",
+        )
+
+        agencies = load_agencies(config_path)
+
+        assert agencies == []
+
+    def test_load_agencies_caches_unchanged_file(self, tmp_path: Path) -> None:
+        """Return the cached list while the file is unchanged on disk."""
+        config_path = _write_config(
+            tmp_path,
+            """
+agencies:
+  - code: "1342000"
+    name: "교육부"
+""",
+        )
+
+        first = load_agencies(config_path)
+        second = load_agencies(config_path)
+
+        assert second is first
+
+    def test_load_agencies_reuses_json_sidecar(self, tmp_path: Path) -> None:
+        """Write a JSON sidecar on first load and prefer it afterwards."""
+        config_path = _write_config(
+            tmp_path,
+            """
+agencies:
+  - code: "1342000"
+    name: "교육부"
+""",
+        )
+
+        load_agencies(config_path)
+
+        sidecar = config_path.with_suffix(".json")
+        assert sidecar.exists()
+
+        # A newer sidecar wins over the YAML on the next load.
+        sidecar.write_text(
+            json.dumps({"agencies": [{"code": "0000001", "name": "사이드카"}]}),
+            encoding="utf-8",
+        )
+
+        agencies = load_agencies(config_path)
+
+        assert agencies == [Agency(code="0000001", name="사이드카")]
+
+    def test_load_agencies_ignores_corrupt_sidecar(self, tmp_path: Path) -> None:
+        """Fall back to the YAML when the sidecar is not valid JSON."""
+        config_path = _write_config(
+            tmp_path,
+            """
+agencies:
+  - code: "1342000"
+    name: "교육부"
+""",
+        )
+        sidecar = config_path.with_suffix(".json")
+        sidecar.write_text("{not json", encoding="utf-8")
 
-            agencies = load_agencies(Path(f.name))
+        agencies = load_agencies(config_path)
 
-            assert agencies == []
+        assert agencies == [Agency(code="1342000", name="교육부")]
+        # The YAML parse rewrites the sidecar with valid JSON.
+        assert json.loads(sidecar.read_text(encoding="utf-8"))
 
     def test_load_agencies_file_not_found(self) -> None:
         """Raise error when config file not found."""
@@ -1,120 +1,239 @@
 """Tests for main entry point and orchestration."""
 
-import logging
+import os
+import py_compile
 import runpy
 import sys
-from datetime import datetime
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+from datetime import datetime, timedelta
 from pathlib import Path
-from types import SimpleNamespace
+from typing import NamedTuple
 
 import pytest
 
 import main as main_module
 
 
-def test_get_target_date_range_monday_returns_friday_to_sunday() -> None:
-    """Return Friday-Sunday window when today is Monday."""
-    monday = datetime(2026, 2, 2)  # Monday
+class _Recorder:
+    """Minimal logger stand-in that records formatted messages."""
 
-    start_date, end_date = main_module.get_target_date_range(today_override=monday)
+    def __init__(self) -> None:
+        self.messages: list[str] = []
 
-    assert start_date == "2026-01-30"
-    assert end_date == "2026-02-01"
+    def info(self, msg: str, *args: object) -> None:
+        self.messages.append(msg % args if args else msg)
 
+    warning = info
+    error = info
 
-def test_get_target_date_range_tuesday_returns_yesterday_only() -> None:
-    """Return yesterday-only window when today is Tuesday."""
-    tuesday = datetime(2026, 2, 3)  # Tuesday
 
-    start_date, end_date = main_module.get_target_date_range(today_override=tuesday)
+# Shared template for fake-client results; per-call copies only swap the
+# agency name.
+_DOC_TEMPLATE = main_module.Document(
+    title="문서", date="2026-02-02", url="", agency_name=""
+)
 
-    assert start_date == "2026-02-02"
-    assert end_date == "2026-02-02"
 
+class _Agency(NamedTuple):
+    """Lightweight stand-in for config.Agency in main() tests."""
 
-def test_find_config_path_prefers_script_relative_path(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Prefer script-relative config/agencies.yaml over cwd path."""
-    script_dir = tmp_path / "package" / "src"
-    script_dir.mkdir(parents=True)
-    script_file = script_dir / "main.py"
-    script_file.write_text("# test", encoding="utf-8")
+    code: str
+    name: str
 
-    script_config = tmp_path / "package" / "config" / "agencies.yaml"
-    script_config.parent.mkdir(parents=True)
-    script_config.write_text("agencies: []\n", encoding="utf-8")
 
-    cwd_dir = tmp_path / "cwd"
-    cwd_dir.mkdir()
-    cwd_config = cwd_dir / "config" / "agencies.yaml"
-    cwd_config.parent.mkdir(parents=True)
-    cwd_config.write_text("agencies: []\n", encoding="utf-8")
+# Agency stubs shared by the main() tests; the loader functions below are
+# swapped in for load_agencies so each test reuses one function object
+# instead of building a fresh lambda and list.
+_ONE_AGENCY = (_Agency("A1", "기관1"),)
+_TWO_AGENCIES = (
+    _Agency("A1", "기관1"),
+    _Agency("A2", "기관2"),
+)
 
-    monkeypatch.chdir(cwd_dir)
-    monkeypatch.setattr(main_module, "__file__", str(script_file))
 
-    config_path = main_module.find_config_path()
+def _load_empty(_path: Path) -> list[_Agency]:
+    return []
 
-    assert config_path == script_config
 
+def _load_one(_path: Path) -> list[_Agency]:
+    return list(_ONE_AGENCY)
 
-def test_find_config_path_falls_back_to_cwd_config(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Use cwd config/agencies.yaml when script-relative file is missing."""
-    script_dir = tmp_path / "package" / "src"
-    script_dir.mkdir(parents=True)
-    script_file = script_dir / "main.py"
-    script_file.write_text("# test", encoding="utf-8")
 
-    cwd_dir = tmp_path / "cwd"
-    cwd_dir.mkdir()
-    cwd_config = cwd_dir / "config" / "agencies.yaml"
-    cwd_config.parent.mkdir(parents=True)
-    cwd_config.write_text("agencies: []\n", encoding="utf-8")
+def _load_two(_path: Path) -> list[_Agency]:
+    return list(_TWO_AGENCIES)
 
-    monkeypatch.chdir(cwd_dir)
-    monkeypatch.setattr(main_module, "__file__", str(script_file))
 
-    config_path = main_module.find_config_path()
+# argv templates shared across tests; stored as tuples so the constants are
+# built once at import and copied into a fresh list only at patch time.
+_ARGV_CONFIG_ONLY = ("open-go-kr", "--config", "/tmp/nonexistent-agencies.yaml")
+_ARGV_SAME_DAY = (
+    *_ARGV_CONFIG_ONLY,
+    "--start-date",
+    "2026-02-02",
+    "--end-date",
+    "2026-02-02",
+)
+_ARGV_DATE_RANGE = (
+    *_ARGV_CONFIG_ONLY,
+    "--start-date",
+    "2026-02-01",
+    "--end-date",
+    "2026-02-02",
+)
+_ARGV_INVALID_RANGE = (
+    "open-go-kr",
+    "--start-date",
+    "2026-02-03",
+    "--end-date",
+    "2026-02-02",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _precompile_main() -> None:
+    """Ensure main.py has an up-to-date .pyc before the runpy test runs.
+
+    runpy re-imports main from source; with the bytecode cache already
+    fresh it loads the .pyc instead of re-compiling the module.
+    """
+    py_compile.compile(main_module.__file__, doraise=True)
+
 
-    assert config_path.resolve() == cwd_config.resolve()
+@pytest.fixture(scope="module", autouse=True)
+def _telegram_env() -> Iterator[None]:
+    """Provide dummy Telegram credentials for every test in the module.
 
+    Set once via os.environ (module scope outlives monkeypatch) and
+    restored afterwards; the missing-credentials test deletes them
+    per-test with monkeypatch.delenv.
+    """
+    keys = ("TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID")
+    saved = {key: os.environ.get(key) for key in keys}
+    os.environ["TELEGRAM_BOT_TOKEN"] = "bot-token"
+    os.environ["TELEGRAM_CHAT_ID"] = "chat-id"
+    yield
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
 
-def test_find_config_path_raises_when_no_config_exists(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+
+def _apply_main_case(
+    monkeypatch: pytest.MonkeyPatch,
+    argv: tuple[str, ...],
+    *,
+    load_agencies: Callable[[Path], list[_Agency]] | None = None,
 ) -> None:
-    """Raise FileNotFoundError when no config candidate exists."""
+    """Apply the argv/config patches shared by the main() tests.
+
+    Args:
+        monkeypatch: The test's monkeypatch fixture.
+        argv: Full sys.argv to run main() with.
+        load_agencies: Replacement for main's load_agencies, when given.
+    """
+    monkeypatch.setattr(sys, "argv", list(argv))
+    if load_agencies is not None:
+        monkeypatch.setattr(main_module, "load_agencies", load_agencies)
+
+
+@pytest.mark.parametrize(
+    ("weekday", "expected"),
+    [
+        pytest.param(0, ("2026-01-30", "2026-02-01"), id="monday-friday-to-sunday"),
+        pytest.param(1, ("2026-02-02", "2026-02-02"), id="tuesday-yesterday"),
+        pytest.param(2, ("2026-02-03", "2026-02-03"), id="wednesday-yesterday"),
+        pytest.param(3, ("2026-02-04", "2026-02-04"), id="thursday-yesterday"),
+        pytest.param(4, ("2026-02-05", "2026-02-05"), id="friday-yesterday"),
+        pytest.param(5, ("2026-02-06", "2026-02-06"), id="saturday-yesterday"),
+        pytest.param(6, ("2026-02-07", "2026-02-07"), id="sunday-yesterday"),
+    ],
+)
+def test_get_target_date_range(weekday: int, expected: tuple[str, str]) -> None:
+    """Cover the Monday backfill window plus yesterday-only for other days."""
+    today = datetime(2026, 2, 2) + timedelta(days=weekday)  # 2026-02-02 is Monday
+    assert today.weekday() == weekday
+
+    assert main_module.get_target_date_range(today_override=today) == expected
+
+
+def _scaffold_config_tree(
+    tmp_path: Path, *, script_config: bool, cwd_config: bool
+) -> tuple[Path, Path, Path]:
+    """Build a fake package/src tree plus the requested config candidates.
+
+    Args:
+        tmp_path: Per-test temporary directory.
+        script_config: Create the script-relative config/agencies.yaml.
+        cwd_config: Create config/agencies.yaml under the cwd candidate.
+
+    Returns:
+        Tuple of (script file, script-relative config path, cwd dir).
+    """
     script_dir = tmp_path / "package" / "src"
     script_dir.mkdir(parents=True)
     script_file = script_dir / "main.py"
-    script_file.write_text("# test", encoding="utf-8")
+    script_file.write_bytes(b"# test\n")
+
+    script_cfg = tmp_path / "package" / "config" / "agencies.yaml"
+    if script_config:
+        script_cfg.parent.mkdir(parents=True)
+        script_cfg.write_bytes(b"agencies: []\n")
 
     cwd_dir = tmp_path / "cwd"
     cwd_dir.mkdir()
-
+    if cwd_config:
+        cwd_cfg = cwd_dir / "config" / "agencies.yaml"
+        cwd_cfg.parent.mkdir(parents=True)
+        cwd_cfg.write_bytes(b"agencies: []\n")
+
+    return script_file, script_cfg, cwd_dir
+
+
+@pytest.mark.parametrize(
+    ("script_config", "cwd_config", "outcome"),
+    [
+        pytest.param(True, True, "script", id="prefers-script-relative"),
+        pytest.param(False, True, "cwd", id="falls-back-to-cwd"),
+        pytest.param(False, False, "raises", id="raises-when-missing"),
+    ],
+)
+def test_find_config_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    script_config: bool,
+    cwd_config: bool,
+    outcome: str,
+) -> None:
+    """Resolve config candidates in priority order: script dir, cwd, error."""
+    script_file, script_cfg, cwd_dir = _scaffold_config_tree(
+        tmp_path, script_config=script_config, cwd_config=cwd_config
+    )
     monkeypatch.chdir(cwd_dir)
     monkeypatch.setattr(main_module, "__file__", str(script_file))
 
-    with pytest.raises(FileNotFoundError):
-        main_module.find_config_path()
+    if outcome == "raises":
+        with pytest.raises(FileNotFoundError):
+            main_module.find_config_path()
+        return
+
+    config_path = main_module.find_config_path()
+
+    if outcome == "script":
+        assert config_path == script_cfg
+    else:
+        expected = cwd_dir / "config" / "agencies.yaml"
+        assert config_path.resolve() == expected.resolve()
 
 
 def test_main_returns_one_when_start_date_is_after_end_date(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Return exit code 1 for invalid date range ordering."""
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "open-go-kr",
-            "--start-date",
-            "2026-02-03",
-            "--end-date",
-            "2026-02-02",
-        ],
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_INVALID_RANGE,
     )
 
     result = main_module.main()
@@ -126,7 +245,7 @@ def test_main_returns_one_when_config_file_is_missing(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Return exit code 1 when no config file can be found."""
-    monkeypatch.setattr(sys, "argv", ["open-go-kr"])
+    _apply_main_case(monkeypatch, ("open-go-kr",))
 
     def _missing_config() -> Path:
         raise FileNotFoundError("missing agencies.yaml")
@@ -146,10 +265,11 @@ def test_main_returns_zero_when_agency_list_is_empty(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Return exit code 0 when no agencies are configured."""
-    monkeypatch.setattr(
-        sys, "argv", ["open-go-kr", "--config", "/tmp/nonexistent-agencies.yaml"]
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_CONFIG_ONLY,
+        load_agencies=_load_empty,
     )
-    monkeypatch.setattr(main_module, "load_agencies", lambda _path: [])
 
     result = main_module.main()
 
@@ -160,13 +280,10 @@ def test_main_returns_one_when_telegram_env_vars_are_missing(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Return exit code 1 when Telegram credentials are missing."""
-    monkeypatch.setattr(
-        sys, "argv", ["open-go-kr", "--config", "/tmp/nonexistent-agencies.yaml"]
-    )
-    monkeypatch.setattr(
-        main_module,
-        "load_agencies",
-        lambda _path: [SimpleNamespace(code="1342000", name="교육부")],
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_CONFIG_ONLY,
+        load_agencies=_load_one,
     )
     monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
     monkeypatch.delenv("TELEGRAM_CHAT_ID", raising=False)
@@ -180,28 +297,10 @@ def test_main_continues_after_one_agency_api_failure_and_returns_one(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Continue remaining agencies after one API failure and return exit code 1."""
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "open-go-kr",
-            "--config",
-            "/tmp/nonexistent-agencies.yaml",
-            "--start-date",
-            "2026-02-02",
-            "--end-date",
-            "2026-02-02",
-        ],
-    )
-    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "bot-token")
-    monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat-id")
-    monkeypatch.setattr(
-        main_module,
-        "load_agencies",
-        lambda _path: [
-            SimpleNamespace(code="A1", name="기관1"),
-            SimpleNamespace(code="A2", name="기관2"),
-        ],
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_SAME_DAY,
+        load_agencies=_load_two,
     )
 
     fetch_calls: list[tuple[str, str, str, str]] = []
@@ -214,14 +313,7 @@ def test_main_continues_after_one_agency_api_failure_and_returns_one(
             fetch_calls.append((code, name, start, end))
             if code == "A1":
                 raise main_module.OpenGoKrError("API failure")
-            return [
-                main_module.Document(
-                    title="문서",
-                    date="2026-02-02",
-                    url="",
-                    agency_name=name,
-                )
-            ]
+            return [replace(_DOC_TEMPLATE, agency_name=name)]
 
     class FakeNotifier:
         def __init__(self, _bot_token: str, _chat_id: str) -> None:
@@ -239,7 +331,7 @@ def test_main_continues_after_one_agency_api_failure_and_returns_one(
     result = main_module.main()
 
     assert result == 1
-    assert [call[0] for call in fetch_calls] == ["A1", "A2"]
+    assert sorted(call[0] for call in fetch_calls) == ["A1", "A2"]
     assert len(sent_payloads) == 1
     assert sent_payloads[0][1][0][0] == "기관2"
 
@@ -248,39 +340,17 @@ def test_main_returns_one_when_notifier_send_fails(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Return exit code 1 when consolidated notifier send raises TelegramError."""
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "open-go-kr",
-            "--config",
-            "/tmp/nonexistent-agencies.yaml",
-            "--start-date",
-            "2026-02-02",
-            "--end-date",
-            "2026-02-02",
-        ],
-    )
-    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "bot-token")
-    monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat-id")
-    monkeypatch.setattr(
-        main_module,
-        "load_agencies",
-        lambda _path: [SimpleNamespace(code="A1", name="기관1")],
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_SAME_DAY,
+        load_agencies=_load_one,
     )
 
     class FakeClient:
         def fetch_documents(
             self, _code: str, name: str, _start: str, _end: str
         ) -> list[main_module.Document]:
-            return [
-                main_module.Document(
-                    title="문서",
-                    date="2026-02-02",
-                    url="",
-                    agency_name=name,
-                )
-            ]
+            return [replace(_DOC_TEMPLATE, agency_name=name)]
 
     class FakeNotifier:
         def __init__(self, _bot_token: str, _chat_id: str) -> None:
@@ -303,28 +373,10 @@ def test_main_returns_zero_when_all_agencies_and_send_succeed(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Return exit code 0 when all agencies succeed and notifier send succeeds."""
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "open-go-kr",
-            "--config",
-            "/tmp/nonexistent-agencies.yaml",
-            "--start-date",
-            "2026-02-02",
-            "--end-date",
-            "2026-02-02",
-        ],
-    )
-    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "bot-token")
-    monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat-id")
-    monkeypatch.setattr(
-        main_module,
-        "load_agencies",
-        lambda _path: [
-            SimpleNamespace(code="A1", name="기관1"),
-            SimpleNamespace(code="A2", name="기관2"),
-        ],
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_SAME_DAY,
+        load_agencies=_load_two,
     )
 
     class FakeClient:
@@ -333,14 +385,7 @@ def test_main_returns_zero_when_all_agencies_and_send_succeed(
         ) -> list[main_module.Document]:
             if code == "A1":
                 return []
-            return [
-                main_module.Document(
-                    title="문서",
-                    date="2026-02-02",
-                    url="",
-                    agency_name=name,
-                )
-            ]
+            return [replace(_DOC_TEMPLATE, agency_name=name)]
 
     sent_payloads: list[tuple[str, list[tuple[str, list[main_module.Document]]]]] = []
 
@@ -366,57 +411,33 @@ def test_main_returns_zero_when_all_agencies_and_send_succeed(
 
 def test_main_formats_date_display_as_range_when_start_and_end_differ(
     monkeypatch: pytest.MonkeyPatch,
-    caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Build date range display when start_date and end_date differ."""
-    caplog.set_level(logging.INFO)
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "open-go-kr",
-            "--config",
-            "/tmp/nonexistent-agencies.yaml",
-            "--start-date",
-            "2026-02-01",
-            "--end-date",
-            "2026-02-02",
-        ],
+    recorder = _Recorder()
+    monkeypatch.setattr(main_module, "logger", recorder)
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_DATE_RANGE,
+        load_agencies=_load_empty,
     )
-    monkeypatch.setattr(main_module, "load_agencies", lambda _path: [])
 
     result = main_module.main()
 
     assert result == 0
-    assert "Fetching documents for date range: 2026-02-01 ~ 2026-02-02" in caplog.text
+    assert any(
+        "Fetching documents for date range: 2026-02-01 ~ 2026-02-02" in message
+        for message in recorder.messages
+    )
 
 
 def test_main_skips_notification_when_all_agencies_return_zero_documents(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Skip Telegram notification when all agencies return empty document lists."""
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "open-go-kr",
-            "--config",
-            "/tmp/nonexistent-agencies.yaml",
-            "--start-date",
-            "2026-02-02",
-            "--end-date",
-            "2026-02-02",
-        ],
-    )
-    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "bot-token")
-    monkeypatch.setenv("TELEGRAM_CHAT_ID", "chat-id")
-    monkeypatch.setattr(
-        main_module,
-        "load_agencies",
-        lambda _path: [
-            SimpleNamespace(code="A1", name="기관1"),
-            SimpleNamespace(code="A2", name="기관2"),
-        ],
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_SAME_DAY,
+        load_agencies=_load_two,
     )
 
     class FakeClient:
@@ -450,16 +471,9 @@ def test_main_module_entrypoint_exits_with_main_return_code(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Invoke module as script and assert SystemExit code from main()."""
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        [
-            "open-go-kr",
-            "--start-date",
-            "2026-02-03",
-            "--end-date",
-            "2026-02-02",
-        ],
+    _apply_main_case(
+        monkeypatch,
+        _ARGV_INVALID_RANGE,
     )
 
     with pytest.raises(SystemExit) as exc_info:
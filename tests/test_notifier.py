@@ -1,12 +1,30 @@
 # Trace: spec_id=SPEC-telegram-notifier-001 task_id=TASK-0002
 """Tests for TelegramNotifier."""
 
+from collections.abc import Iterator
+
 import pytest
 import responses
 
 from client import Document
 from notifier import TelegramError, TelegramNotifier
 
+# The agency name as raw UTF-8 and as the \uXXXX escapes json.dumps emits,
+# so request bodies can be checked without decoding them first.
+_AGENCY_UTF8 = "교육부".encode()
+_AGENCY_JSON = b"\\uad50\\uc721\\ubd80"
+
+# Built once at import time; the long-message test only reads it.
+_MANY_DOCS = tuple(
+    Document(
+        title=f"문서 제목이 매우 긴 경우를 테스트하기 위한 문서 번호 {i}",
+        date="2025-12-27",
+        url=f"https://example.com/very/long/path/document/{i}",
+        agency_name="교육부",
+    )
+    for i in range(50)
+)
+
 
 class TestTelegramNotifier:
     """Test suite for TelegramNotifier."""
@@ -15,15 +33,23 @@ class TestTelegramNotifier:
     CHAT_ID = "-1001234567890"
     API_URL = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
 
-    @pytest.fixture
-    def notifier(self) -> TelegramNotifier:
-        """Create a notifier instance for testing."""
-        return TelegramNotifier(self.BOT_TOKEN, self.CHAT_ID)
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def notifier() -> TelegramNotifier:
+        """Create one notifier instance shared across the class.
 
-    @pytest.fixture
-    def sample_documents(self) -> list[Document]:
-        """Create sample documents for testing."""
-        return [
+        The notifier holds no per-test state (responses resets the HTTP
+        layer between tests), so class scope is safe.
+        """
+        return TelegramNotifier(
+            TestTelegramNotifier.BOT_TOKEN, TestTelegramNotifier.CHAT_ID
+        )
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def sample_documents() -> tuple[Document, ...]:
+        """Create immutable sample documents shared across the class."""
+        return (
             Document(
                 title="2024년 교육정책 보고서",
                 date="2025-12-27",
@@ -36,40 +62,61 @@ class TestTelegramNotifier:
                 url="https://example.com/doc2",
                 agency_name="교육부",
             ),
-        ]
+        )
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def _shared_rsps() -> Iterator[responses.RequestsMock]:
+        """Patch the HTTP layer once per class instead of per test."""
+        mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+        mock.start()
+        yield mock
+        mock.stop()
+
+    @pytest.fixture
+    @staticmethod
+    def rsps(
+        _shared_rsps: responses.RequestsMock,
+    ) -> Iterator[responses.RequestsMock]:
+        """Hand tests the shared mock, cleared between tests."""
+        yield _shared_rsps
+        _shared_rsps.reset()
 
     # TEST-telegram-notifier-001: Successfully send formatted document list
-    @responses.activate
     def test_send_documents_success(
-        self, notifier: TelegramNotifier, sample_documents: list[Document]
+        self,
+        notifier: TelegramNotifier,
+        sample_documents: tuple[Document, ...],
+        rsps: responses.RequestsMock,
     ) -> None:
         """Send formatted document list successfully."""
-        responses.add(
-            responses.POST,
+        rsps.add(
+            rsps.POST,
             self.API_URL,
             json={"ok": True, "result": {"message_id": 123}},
             status=200,
         )
 
-        result = notifier.send_documents("교육부", "2025-12-27", sample_documents)
+        result = notifier.send_documents("교육부", "2025-12-27", list(sample_documents))
 
         assert result is True
-        assert len(responses.calls) == 1
+        assert len(rsps.calls) == 1
 
         # Verify message contains document info
-        request_body = responses.calls[0].request.body
+        request_body = rsps.calls[0].request.body
         assert request_body is not None
-        body_str = (
-            request_body.decode() if isinstance(request_body, bytes) else request_body
+        body = (
+            request_body if isinstance(request_body, bytes) else request_body.encode()
         )
-        assert "교육부" in body_str or "%EA%B5%90%EC%9C%A1%EB%B6%80" in body_str
+        assert _AGENCY_UTF8 in body or _AGENCY_JSON in body
 
     # TEST-telegram-notifier-002: Handle empty document list with appropriate message
-    @responses.activate
-    def test_send_documents_empty(self, notifier: TelegramNotifier) -> None:
+    def test_send_documents_empty(
+        self, notifier: TelegramNotifier, rsps: responses.RequestsMock
+    ) -> None:
         """Send appropriate message when no documents found."""
-        responses.add(
-            responses.POST,
+        rsps.add(
+            rsps.POST,
             self.API_URL,
             json={"ok": True, "result": {"message_id": 123}},
             status=200,
@@ -78,14 +125,15 @@ class TestTelegramNotifier:
         result = notifier.send_documents("교육부", "2025-12-27", [])
 
         assert result is True
-        assert len(responses.calls) == 1
+        assert len(rsps.calls) == 1
 
     # TEST-telegram-notifier-003: Raise error on invalid credentials
-    @responses.activate
-    def test_send_documents_invalid_token(self, notifier: TelegramNotifier) -> None:
+    def test_send_documents_invalid_token(
+        self, notifier: TelegramNotifier, rsps: responses.RequestsMock
+    ) -> None:
         """Raise TelegramError on invalid credentials."""
-        responses.add(
-            responses.POST,
+        rsps.add(
+            rsps.POST,
             self.API_URL,
             json={"ok": False, "error_code": 401, "description": "Unauthorized"},
             status=401,
@@ -96,13 +144,14 @@ class TestTelegramNotifier:
 
         assert "401" in str(exc_info.value) or "Unauthorized" in str(exc_info.value)
 
-    @responses.activate
-    def test_send_documents_network_error(self, notifier: TelegramNotifier) -> None:
+    def test_send_documents_network_error(
+        self, notifier: TelegramNotifier, rsps: responses.RequestsMock
+    ) -> None:
         """Wrap request-level network failures as TelegramError."""
         import requests
 
-        responses.add(
-            responses.POST,
+        rsps.add(
+            rsps.POST,
             self.API_URL,
             body=requests.exceptions.ConnectionError("Connection aborted"),
         )
@@ -112,9 +161,26 @@ class TestTelegramNotifier:
 
         assert "Network error" in str(exc_info.value)
 
-    @responses.activate
+    def test_send_documents_non_json_response(
+        self, notifier: TelegramNotifier, rsps: responses.RequestsMock
+    ) -> None:
+        """Raise TelegramError when the API body is not JSON."""
+        # An intermediary error page; 400 is outside the retry list, so
+        # the decode failure surfaces instead of exhausting retries.
+        rsps.add(
+            rsps.POST,
+            self.API_URL,
+            body="<html><body>Bad Gateway</body></html>",
+            status=400,
+        )
+
+        with pytest.raises(TelegramError) as exc_info:
+            notifier.send_documents("교육부", "2025-12-27", [])
+
+        assert "Invalid API response" in str(exc_info.value)
+
     def test_send_multi_agency_documents_success(
-        self, notifier: TelegramNotifier
+        self, notifier: TelegramNotifier, rsps: responses.RequestsMock
     ) -> None:
         """Send consolidated multi-agency notification successfully."""
         agencies_documents = [
@@ -130,8 +196,8 @@ class TestTelegramNotifier:
                 ],
             )
         ]
-        responses.add(
-            responses.POST,
+        rsps.add(
+            rsps.POST,
             self.API_URL,
             json={"ok": True, "result": {"message_id": 321}},
             status=200,
@@ -140,11 +206,10 @@ class TestTelegramNotifier:
         result = notifier.send_multi_agency_documents("2025-12-27", agencies_documents)
 
         assert result is True
-        assert len(responses.calls) == 1
+        assert len(rsps.calls) == 1
 
-    @responses.activate
     def test_send_multi_agency_documents_long_message(
-        self, notifier: TelegramNotifier
+        self, notifier: TelegramNotifier, rsps: responses.RequestsMock
     ) -> None:
         """Split and send multi-agency message when it exceeds Telegram limit."""
         agencies_documents = [
@@ -164,8 +229,8 @@ class TestTelegramNotifier:
                 ],
             )
         ]
-        responses.add_callback(
-            responses.POST,
+        rsps.add_callback(
+            rsps.POST,
             self.API_URL,
             callback=lambda _request: (
                 200,
@@ -177,55 +242,36 @@ class TestTelegramNotifier:
         result = notifier.send_multi_agency_documents("2025-12-27", agencies_documents)
 
         assert result is True
-        assert len(responses.calls) >= 2
+        assert len(rsps.calls) >= 2
 
     # TEST-telegram-notifier-004: Split long messages correctly
-    @responses.activate
-    def test_send_documents_long_message(self, notifier: TelegramNotifier) -> None:
+    def test_send_documents_long_message(
+        self, notifier: TelegramNotifier, rsps: responses.RequestsMock
+    ) -> None:
         """Split message when it exceeds Telegram limit."""
-        # Create many documents to exceed 4096 char limit
-        many_documents = [
-            Document(
-                title=f"문서 제목이 매우 긴 경우를 테스트하기 위한 문서 번호 {i}",
-                date="2025-12-27",
-                url=f"https://example.com/very/long/path/document/{i}",
-                agency_name="교육부",
-            )
-            for i in range(50)
-        ]
-
-        responses.add(
-            responses.POST,
+        # One registration matches every chunk request.
+        rsp = rsps.add(
+            rsps.POST,
             self.API_URL,
             json={"ok": True, "result": {"message_id": 123}},
             status=200,
         )
-        responses.add(
-            responses.POST,
-            self.API_URL,
-            json={"ok": True, "result": {"message_id": 124}},
-            status=200,
-        )
-        responses.add(
-            responses.POST,
-            self.API_URL,
-            json={"ok": True, "result": {"message_id": 125}},
-            status=200,
-        )
 
-        result = notifier.send_documents("교육부", "2025-12-27", many_documents)
+        result = notifier.send_documents("교육부", "2025-12-27", list(_MANY_DOCS))
 
         assert result is True
         # Should have made multiple API calls
-        assert len(responses.calls) >= 1
+        assert rsp.call_count >= 2
 
-    @responses.activate
     def test_format_message(
-        self, notifier: TelegramNotifier, sample_documents: list[Document]
+        self,
+        notifier: TelegramNotifier,
+        sample_documents: tuple[Document, ...],
+        rsps: responses.RequestsMock,
     ) -> None:
         """Message format includes all required elements."""
-        responses.add(
-            responses.POST,
+        rsps.add(
+            rsps.POST,
             self.API_URL,
             json={"ok": True, "result": {"message_id": 123}},
             status=200,
@@ -233,7 +279,7 @@ class TestTelegramNotifier:
 
         notifier.send_documents("교육부", "2025-12-27", sample_documents)
 
-        request_body = responses.calls[0].request.body
+        request_body = rsps.calls[0].request.body
         # URL encoded Korean text or actual text should be present
         assert request_body is not None
         assert len(request_body) > 0
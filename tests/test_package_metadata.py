@@ -1,9 +1,10 @@
 """Tests for package metadata exposure."""
 
+import src
+
 
 def test_star_import_exposes_version() -> None:
     """Expose __version__ when importing from src package."""
-    namespace: dict[str, object] = {}
-    exec("from src import *", namespace)
-
-    assert namespace["__version__"] == "0.1.0"
+    assert src.__version__ == "0.1.0"
+    # __all__ membership is what makes the star import carry it.
+    assert "__version__" in src.__all__